@@ -2,19 +2,33 @@
 """
 Lambda: igp_sismos_api.lambda_handler
 Obtiene los 10 últimos sismos REALES del IGP (ArcGIS REST) y los guarda en DynamoDB.
-No genera datos de ejemplo. Si no hay datos, devuelve 500.
+No genera datos de ejemplo. Si no hay datos, devuelve 502; ante errores, 500.
 """
 
-import json
+import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 import boto3
+from botocore.config import Config
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ------------------ Config ------------------
+# En Lambda el root logger ya tiene handler hacia CloudWatch
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
 DYNAMODB_TABLE = os.environ.get("DYNAMODB_TABLE", "SismosIGP")
+# Verificar/crear la tabla en runtime (AUTO_CREATE_TABLE=0 si la provisiona IaC)
+AUTO_CREATE_TABLE = os.environ.get("AUTO_CREATE_TABLE", "1") == "1"
+# JSON compacto por defecto; DEBUG_JSON=1 lo indenta para depurar
+_JSON_OPTS = orjson.OPT_INDENT_2 if os.environ.get("DEBUG_JSON") == "1" else 0
 # Página pública (referencia)
 IGP_PAGE_URL = "https://ultimosismo.igp.gob.pe/ultimo-sismo/sismos-reportados"
 # Backend oficial ArcGIS que alimenta la página
@@ -22,6 +36,66 @@ ARCGIS_QUERY_URL = (
     "https://ide.igp.gob.pe/arcgis/rest/services/monitoreocensis/"
     "SismosReportados/MapServer/0/query"
 )
+# Parámetros fijos de la consulta: 10 últimos sismos, sin geometría
+_ARCGIS_PARAMS = {
+    "where": "1=1",
+    "outFields": "*",
+    "orderByFields": "fechaevento DESC",
+    "resultRecordCount": 10,
+    "returnGeometry": "false",
+    "f": "json",
+}
+
+# Sesión HTTP a nivel de módulo: Lambda la reutiliza entre invocaciones "warm"
+# (keep-alive), evitando un nuevo handshake TCP + TLS contra ide.igp.gob.pe.
+_SESSION = requests.Session()
+# Timeout (connect, read) de cada intento contra ArcGIS
+_ARCGIS_TIMEOUT = (3.05, 10)
+# Reintentos ante fallos transitorios del servidor del IGP. Un solo reintento
+# (total=1), que también cubre el socket keep-alive cerrado mientras el
+# contenedor estaba congelado (urllib3 lo cuenta como error de lectura). Sin
+# respetar Retry-After: en el peor caso 2 intentos × (3.05 + 10) s ≈ 26 s, por
+# debajo de los 29 s de API Gateway y los 60 s de la Lambda.
+_RETRY = Retry(
+    total=1,
+    connect=1,
+    read=1,
+    status=1,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=False,
+)
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=_RETRY)
+)
+_SESSION.headers.update(
+    {
+        "User-Agent": "IGP-Sismos/1.0 (+lambda)",
+        "Accept": "application/json,text/plain,*/*",
+        # ArcGIS comprime el JSON; requests lo descomprime de forma transparente
+        "Accept-Encoding": "gzip",
+    }
+)
+
+# Clientes DynamoDB a nivel de módulo: se reutilizan (con su pool de conexiones)
+# en invocaciones "warm" en lugar de recrearse en cada llamada. Comparten una
+# sola boto3 Session para cargar los modelos de botocore una única vez.
+_DDB_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+)
+_BOTO_SESSION = boto3.session.Session()
+_DDB_CLIENT = _BOTO_SESSION.client("dynamodb", config=_DDB_CONFIG)
+_DDB_RES = _BOTO_SESSION.resource("dynamodb", config=_DDB_CONFIG)
+_DDB_TABLE = _DDB_RES.Table(DYNAMODB_TABLE)
+
+# La tabla solo se verifica una vez por contenedor (ver create_dynamodb_table)
+_TABLE_READY = False
+
+# Pool reutilizado entre invocaciones para solapar DescribeTable y ArcGIS
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
 
 
 # ================== Lambda Handler ==================
@@ -29,140 +103,144 @@ def lambda_handler(event, context):
     """
     GET que obtiene los 10 últimos sismos REALES del IGP (ArcGIS REST)
     y los almacena en DynamoDB. No crea datos ficticios.
+    Con ?detail=1 la respuesta incluye los sismos extraídos (sismos_detalle).
     """
     try:
-        print("🚀 Iniciando extracción real de IGP (ArcGIS REST)")
-        print(f"📅 Timestamp: {datetime.now(timezone.utc).isoformat()}")
-
-        # 1) Verificar/crear tabla
-        print("🔧 Verificando/creando tabla DynamoDB…")
-        create_dynamodb_table()
-
-        # 2) Scraping real (ArcGIS)
-        print("🌐 Consultando backend ArcGIS del IGP…")
-        sismos = scrape_sismos_from_igp()  # <- SOLO datos reales
+        # Un único timestamp por invocación (log, scraped_at y respuesta)
+        now_iso = datetime.now(timezone.utc).isoformat()
+        logger.info("🚀 Iniciando extracción real de IGP (ArcGIS REST)")
+        logger.info("📅 Timestamp: %s", now_iso)
+
+        # 1) Verificar/crear tabla (solo en el cold start del contenedor) y
+        # 2) Scraping real (ArcGIS). Son I/O independientes: van en paralelo.
+        logger.info("🌐 Consultando backend ArcGIS del IGP…")
+        if AUTO_CREATE_TABLE and not _TABLE_READY:
+            logger.info("🔧 Verificando/creando tabla DynamoDB…")
+            f_table = _EXECUTOR.submit(create_dynamodb_table)
+            f_sismos = _EXECUTOR.submit(scrape_sismos_from_igp, now_iso)
+            f_table.result()
+            sismos = f_sismos.result()  # <- SOLO datos reales
+        else:
+            sismos = scrape_sismos_from_igp(now_iso)  # <- SOLO datos reales
 
         if not sismos:
-            raise RuntimeError("El servicio ArcGIS no devolvió sismos.")
+            error_message = "❌ Error: El servicio ArcGIS no devolvió sismos."
+            logger.error(error_message)
+            return _response(502, {"error": error_message, "timestamp": now_iso})
 
         # 3) Guardar en DynamoDB
-        print("💾 Almacenando sismos en DynamoDB…")
+        logger.info("💾 Almacenando sismos en DynamoDB…")
         saved_count = save_sismos_to_dynamodb(sismos)
 
         # 4) Respuesta
         response_data = {
-            "statusCode": 200,
             "message": "✅ Extracción y almacenamiento completados",
             "data": {
                 "sismos_extraidos": len(sismos),
                 "sismos_guardados": saved_count,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": now_iso,
                 "source_url": IGP_PAGE_URL,
                 "backend_url": ARCGIS_QUERY_URL,
-                "sismos_detalle": sismos,
             },
         }
+        # El detalle completo solo se serializa si se pide con ?detail=1
+        params = (event or {}).get("queryStringParameters") or {}
+        if params.get("detail") == "1":
+            response_data["data"]["sismos_detalle"] = sismos
 
-        print(f"✅ Proceso completado: {len(sismos)} extraídos, {saved_count} guardados")
-        return {
-            "statusCode": 200,
-            "headers": _cors_headers(),
-            "body": json.dumps(response_data, ensure_ascii=False, default=str, indent=2),
-        }
+        logger.info("✅ Proceso completado: %d extraídos, %d guardados", len(sismos), saved_count)
+        return _response(200, response_data)
 
     except Exception as e:
         error_message = f"❌ Error: {str(e)}"
-        print(error_message)
-        return {
-            "statusCode": 500,
-            "headers": _cors_headers(),
-            "body": json.dumps(
-                {
-                    "statusCode": 500,
-                    "error": error_message,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                },
-                ensure_ascii=False,
-                indent=2,
-            ),
-        }
+        logger.error(error_message)
+        return _response(
+            500, {"error": error_message, "timestamp": datetime.now(timezone.utc).isoformat()}
+        )
 
 
 # ================== Scraping real (ArcGIS) ==================
-def scrape_sismos_from_igp():
+# Variantes de nombre (en minúsculas) de los atributos ArcGIS con alias
+_CODE_KEYS = ("code", "codigo")
+_LAT_KEYS = ("lat", "latitude", "y")
+_LON_KEYS = ("lon", "longitud", "longitude", "x")
+_MAGNITUD_KEYS = ("magnitud", "magnitude")
+_PROF_KEYS = ("prof", "profundidad", "depth")
+_REF_KEYS = ("ref", "referencia", "lugar")
+
+
+def scrape_sismos_from_igp(scraped_at=None):
     """
     Obtiene los 10 últimos sismos REALES del backend ArcGIS (JSON).
-    NUNCA genera datos de ejemplo. Lanza excepción si no hay datos.
+    NUNCA genera datos de ejemplo. Devuelve [] si ArcGIS no trae sismos válidos;
+    solo lanza excepción ante errores HTTP o de ArcGIS.
+    `scraped_at` (ISO UTC) se comparte con el handler para que todo el lote
+    tenga el mismo valor; si falta, se calcula aquí.
     """
-    params = {
-        "where": "1=1",
-        "outFields": "*",
-        "orderByFields": "fechaevento DESC",
-        "resultRecordCount": 10,
-        "returnGeometry": "false",
-        "f": "json",
-    }
-    headers = {
-        "User-Agent": "IGP-Sismos/1.0 (+lambda)",
-        "Accept": "application/json,text/plain,*/*",
-    }
-
-    resp = requests.get(ARCGIS_QUERY_URL, params=params, headers=headers, timeout=20)
+    resp = _SESSION.get(ARCGIS_QUERY_URL, params=_ARCGIS_PARAMS, timeout=_ARCGIS_TIMEOUT)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
 
     if "error" in data:
         raise RuntimeError(f"ArcGIS error: {data['error']}")
 
     feats = data.get("features", [])
     if not feats:
-        raise RuntimeError("ArcGIS no devolvió 'features'.")
+        logger.warning("⚠️ ArcGIS no devolvió 'features'.")
+        return []
 
-    sismos = []
-    scraped_at = datetime.now(timezone.utc).isoformat()
+    # Tamaño máximo conocido (resultRecordCount): se preasigna y se recorta al final
+    sismos = [None] * len(feats)
+    n = 0
+    if scraped_at is None:
+        scraped_at = datetime.now(timezone.utc).isoformat()
 
     for f in feats:
-        a = f.get("attributes", {}) or {}
+        # Claves normalizadas a minúsculas una sola vez por feature
+        a = {k.lower(): v for k, v in (f.get("attributes") or {}).items()}
 
         # Mapeo robusto con variantes de nombres
-        code = _first(a, "code", "CODIGO", "Codigo")
-        objectid = _first(a, "objectid", "OBJECTID", "ObjectID")
+        code = _first(a, _CODE_KEYS)
+        objectid = a.get("objectid")
         sismo_id = str(code or f"OBJ-{objectid}")
 
-        item = {
-            "id": sismo_id,
-            "code": code or "",
-            "fecha": _first(a, "fecha", "FECHA"),
-            "hora": _first(a, "hora", "HORA"),
-            "latitud": _to_decimal(_first(a, "lat", "LAT", "latitude", "Latitude", "y", "Y")),
-            "longitud": _to_decimal(_first(a, "lon", "LON", "longitud", "Longitude", "x", "X")),
-            "magnitud": _to_decimal(_first(a, "magnitud", "MAGNITUD", "magnitude", "MAGNITUDE")),
-            "mag_tipo": _first(a, "mag", "MAG"),
-            "profundidad_km": _to_decimal(_first(a, "prof", "PROF", "profundidad", "PROFUNDIDAD", "depth")),
-            "profundidad_tipo": _first(a, "profundidad", "PROFUNDIDAD"),
-            "referencia": _first(a, "ref", "REF", "referencia", "Referencia", "lugar", "LUGAR"),
-            "departamento": _first(a, "departamento", "DEPARTAMENTO"),
-            "intensidad": _first(a, "int_", "INT_"),
-            "sentido": _first(a, "sentido", "SENTIDO"),
-            "fechaevento_epoch_ms": _first(a, "fechaevento", "FECHAEVENTO"),
-            "scraped_at": scraped_at,
-            "source": "IGP",
-            "url_source": IGP_PAGE_URL,
-        }
+        # Construcción en una sola pasada: solo se insertan valores no vacíos
+        item = {"id": sismo_id}
+        _put(item, "code", code)
+        _put(item, "fecha", a.get("fecha"))
+        _put(item, "hora", a.get("hora"))
+        _put(item, "latitud", _to_decimal(_first(a, _LAT_KEYS)))
+        _put(item, "longitud", _to_decimal(_first(a, _LON_KEYS)))
+        _put(item, "magnitud", _to_decimal(_first(a, _MAGNITUD_KEYS)))
+        _put(item, "mag_tipo", a.get("mag"))
+        _put(item, "profundidad_km", _to_decimal(_first(a, _PROF_KEYS)))
+        _put(item, "profundidad_tipo", a.get("profundidad"))
+        _put(item, "referencia", _first(a, _REF_KEYS))
+        _put(item, "departamento", a.get("departamento"))
+        _put(item, "intensidad", a.get("int_"))
+        _put(item, "sentido", a.get("sentido"))
+        _put(item, "fechaevento_epoch_ms", a.get("fechaevento"))
+        item["scraped_at"] = scraped_at
+        item["source"] = "IGP"
+        item["url_source"] = IGP_PAGE_URL
 
         # Reglas mínimas para aceptar el registro (evita ítems “nulos”):
-        if all(item.get(k) is not None for k in ("magnitud", "latitud", "longitud")):
-            sismos.append(_sanitize(item))
+        if all(k in item for k in ("magnitud", "latitud", "longitud")):
+            sismos[n] = item
+            n += 1
         else:
-            print(f"🚫 Ignorado por campos clave faltantes: {sismo_id}")
+            logger.debug("🚫 Ignorado por campos clave faltantes: %s", sismo_id)
+    del sismos[n:]
 
-    if not sismos:
-        raise RuntimeError("Ningún sismo cumplió las reglas mínimas (mapeo).")
+    # Resumen único en lugar de una línea por fila
+    logger.info("📊 ArcGIS: %d features, %d válidos, %d ignorados", len(feats), n, len(feats) - n)
 
+    if not sismos:
+        logger.warning("⚠️ Ningún sismo cumplió las reglas mínimas (mapeo).")
     return sismos
 
 
-def _first(attrs, *keys):
+def _first(attrs, keys):
     """Devuelve el primer valor no vacío para cualquiera de las claves dadas."""
     for k in keys:
         v = attrs.get(k)
@@ -172,17 +250,27 @@ def _first(attrs, *keys):
 
 
 def _to_decimal(val):
+    """Convierte a Decimal (Dynamo no acepta float) sin pasar por str() si ya es numérico."""
     if val is None:
         return None
+    if isinstance(val, bool):
+        # bool es subclase de int; un flag no es una coordenada ni magnitud
+        return None
+    if isinstance(val, int):
+        return Decimal(val)
+    if isinstance(val, float):
+        # repr() da el decimal más corto que representa al float (4.3 -> "4.3")
+        return Decimal(repr(val))
     try:
-        return Decimal(str(val))
-    except Exception:
+        return Decimal(val)
+    except (InvalidOperation, TypeError, ValueError):
         return None
 
 
-def _sanitize(item: dict) -> dict:
-    """Quita campos None o vacíos para no ensuciar Dynamo."""
-    return {k: v for k, v in item.items() if v not in (None, "", " ")}
+def _put(item: dict, key, val):
+    """Agrega el campo solo si no es None o vacío, para no ensuciar Dynamo."""
+    if val not in (None, "", " "):
+        item[key] = val
 
 
 # ================== DynamoDB helpers ==================
@@ -190,16 +278,20 @@ def create_dynamodb_table():
     """
     Crea la tabla si no existe. PK 'id' (S) y GSI por 'scraped_at' (S),
     compatible con tu serverless.yml (PROVISIONED 5/5).
+    Tras el primer éxito no vuelve a llamar a DescribeTable en el contenedor.
     """
+    global _TABLE_READY
+    if _TABLE_READY:
+        return True
     try:
-        client = boto3.client("dynamodb")
         try:
-            client.describe_table(TableName=DYNAMODB_TABLE)
-            print(f"✅ Tabla {DYNAMODB_TABLE} ya existe")
+            _DDB_CLIENT.describe_table(TableName=DYNAMODB_TABLE)
+            logger.info("✅ Tabla %s ya existe", DYNAMODB_TABLE)
+            _TABLE_READY = True
             return True
-        except client.exceptions.ResourceNotFoundException:
-            print(f"🔧 Creando tabla {DYNAMODB_TABLE}…")
-            client.create_table(
+        except _DDB_CLIENT.exceptions.ResourceNotFoundException:
+            logger.info("🔧 Creando tabla %s…", DYNAMODB_TABLE)
+            _DDB_CLIENT.create_table(
                 TableName=DYNAMODB_TABLE,
                 KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
                 AttributeDefinitions=[
@@ -217,58 +309,121 @@ def create_dynamodb_table():
                 BillingMode="PROVISIONED",
                 ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
             )
-            waiter = client.get_waiter("table_exists")
+            waiter = _DDB_CLIENT.get_waiter("table_exists")
             waiter.wait(TableName=DYNAMODB_TABLE)
-            print(f"✅ Tabla {DYNAMODB_TABLE} creada")
+            logger.info("✅ Tabla %s creada", DYNAMODB_TABLE)
+            _TABLE_READY = True
             return True
     except Exception as e:
-        print(f"❌ Error creando tabla: {str(e)}")
+        logger.error("❌ Error creando tabla: %s", e)
         return False
 
 
+# Intentos de BatchGetItem por bloque antes de dar por "desconocidas" las
+# UnprocessedKeys (con backoff exponencial entre intentos)
+_BATCH_GET_MAX_ATTEMPTS = 4
+
+
+def filter_new_sismos(sismos):
+    """
+    Devuelve solo los sismos cuyo 'id' aún no existe en DynamoDB, usando
+    BatchGetItem (100 claves por request, lectura eventual, solo el 'id').
+    Las claves que siguen sin procesarse tras los reintentos se tratan como
+    desconocidas y se devuelven como nuevas (se escriben como upsert).
+    """
+    existing = set()
+    ids = [s["id"] for s in sismos]
+    for i in range(0, len(ids), 100):
+        request = {
+            DYNAMODB_TABLE: {
+                "Keys": [{"id": k} for k in ids[i:i + 100]],
+                "ProjectionExpression": "#id",
+                "ExpressionAttributeNames": {"#id": "id"},
+                "ConsistentRead": False,
+            }
+        }
+        for attempt in range(1, _BATCH_GET_MAX_ATTEMPTS + 1):
+            resp = _DDB_RES.batch_get_item(RequestItems=request)
+            existing.update(r["id"] for r in resp["Responses"].get(DYNAMODB_TABLE, []))
+            request = resp.get("UnprocessedKeys")
+            if not request:
+                break
+            if attempt == _BATCH_GET_MAX_ATTEMPTS:
+                logger.warning(
+                    "⚠️ BatchGetItem: %d claves sin procesar; se tratan como nuevas",
+                    len(request[DYNAMODB_TABLE]["Keys"]),
+                )
+                break
+            # Backoff exponencial acotado antes de reenviar (throttling)
+            time.sleep(min(0.05 * 2 ** attempt, 1.0))
+    return [s for s in sismos if s["id"] not in existing]
+
+
 def save_sismos_to_dynamodb(sismos):
     """
     Guarda sismos en DynamoDB (sin duplicar id y saltando registros incompletos).
+    Un BatchGetItem descarta los ya guardados y los nuevos se escriben con
+    BatchWriteItem (hasta 25 ítems por request).
     """
     try:
-        dynamodb = boto3.resource("dynamodb")
-        table = dynamodb.Table(DYNAMODB_TABLE)
-
-        saved = 0
+        # Validación extra por si acaso; el dict deja un solo ítem por id
+        pending, skipped_ids = {}, []
         for s in sismos:
-            # Validación extra por si acaso
             if any(s.get(k) is None for k in ("magnitud", "latitud", "longitud")):
-                print(f"⏭️  Skip por datos clave faltantes: {s.get('id')}")
+                skipped_ids.append(s.get("id"))
                 continue
-            try:
-                table.put_item(Item=s, ConditionExpression="attribute_not_exists(id)")
-                saved += 1
-                print(f"💾 Guardado: {s['id']} Mag {s.get('magnitud')}")
-            except dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
-                print(f"ℹ️ Ya existe: {s['id']}")
-            except Exception as e:
-                print(f"❌ Error guardando {s.get('id')}: {str(e)}")
-
-        print(f"✅ Guardados {saved}/{len(sismos)}")
-        return saved
+            pending[s["id"]] = s
+
+        new_sismos = filter_new_sismos(list(pending.values())) if pending else []
+
+        # batch_writer agrupa en lotes de 25 y reintenta los UnprocessedItems
+        with _DDB_TABLE.batch_writer() as batch:
+            for s in new_sismos:
+                batch.put_item(Item=s)
+
+        saved_ids = [s["id"] for s in new_sismos]
+        # Una sola línea de log por lote en lugar de una por ítem
+        logger.info(
+            "✅ Guardados %d/%d (ya existían %d, omitidos %d) ids=%s",
+            len(saved_ids), len(sismos), len(pending) - len(saved_ids),
+            len(skipped_ids), saved_ids,
+        )
+        return len(saved_ids)
     except Exception as e:
-        print(f"❌ Error guardando en DynamoDB: {str(e)}")
+        logger.error("❌ Error guardando en DynamoDB: %s", e)
         return 0
 
 
 # ================== Util ==================
-def _cors_headers():
-    return {
-        "Content-Type": "application/json; charset=utf-8",
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
-        "Access-Control-Allow-Methods": "GET,OPTIONS",
-    }
+def _json_default(o):
+    """Serializa los Decimal (tipo numérico de Dynamo) como número JSON."""
+    if isinstance(o, Decimal):
+        return float(o)
+    raise TypeError(f"Tipo no serializable: {type(o).__name__}")
+
+
+def _json_dumps(obj) -> str:
+    """JSON compacto en UTF-8 (orjson) para el body de la respuesta."""
+    return orjson.dumps(obj, default=_json_default, option=_JSON_OPTS).decode()
+
+
+_CORS_HEADERS = {
+    "Content-Type": "application/json; charset=utf-8",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
+    "Access-Control-Allow-Methods": "GET,OPTIONS",
+}
+
+
+def _response(status: int, body: dict) -> dict:
+    """Respuesta proxy de API Gateway; el status va solo fuera del body."""
+    return {"statusCode": status, "headers": _CORS_HEADERS, "body": _json_dumps(body)}
 
 
 # ================== Prueba local ==================
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     print("🧪 Ejecutando prueba local…")
     event = {"httpMethod": "GET", "path": "/"}
     result = lambda_handler(event, None)
-    print(json.dumps(result, indent=2, ensure_ascii=False, default=str))
+    print(orjson.dumps(result, default=_json_default, option=orjson.OPT_INDENT_2).decode())